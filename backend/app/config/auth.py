@@ -1,20 +1,19 @@
-import os
 from datetime import datetime, timedelta, timezone
-from dotenv import load_dotenv
 from jose import jwt, JWTError
 from fastapi.security import OAuth2PasswordBearer
 from fastapi import Depends, HTTPException
 from passlib.context import CryptContext
 
+from app.config.settings import get_settings
 from app.utils.responses import format_response
 
-# --- Load environment variables ---
-load_dotenv()
+# --- Configuration ---
+settings = get_settings()
 
-SECRET_KEY = os.getenv("SECRET_KEY")
-ALGORITHM = os.getenv("ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
-REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 7))
+SECRET_KEY = settings.secret_key
+ALGORITHM = settings.algorithm
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.access_token_expire_minutes
+REFRESH_TOKEN_EXPIRE_DAYS = settings.refresh_token_expire_days
 
 if not SECRET_KEY:
     raise RuntimeError("SECRET_KEY is missing! Define it in your environment variables.")
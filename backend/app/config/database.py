@@ -1,16 +1,12 @@
-import os
-from dotenv import load_dotenv
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from fastapi import HTTPException
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from app.config.settings import get_settings
 from app.models.models import Base
 
-# Load environment variables
-load_dotenv()
-
-# Determine environment (Docker vs local)
-is_docker = os.getenv("DOCKER_ENV", "false").lower() == "true"
-database_url = os.getenv("DATABASE_URL_DOCKER" if is_docker else "DATABASE_URL_LOCAL")
+# Database URL is resolved from DOCKER_ENV in the settings
+database_url = get_settings().database_url
 
 if not database_url:
     raise RuntimeError("DATABASE_URL is missing. Define it in your environment variables.")
@@ -41,6 +37,9 @@ async def get_db():
     async with AsyncSessionLocal() as session:
         try:
             yield session
+        except StarletteHTTPException:
+            # Raised by endpoints or later dependencies (auth, rate limiting): keep as-is
+            raise
         except Exception as e:
             raise HTTPException(status_code=500, detail={
                 "status": "error",
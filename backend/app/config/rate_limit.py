@@ -0,0 +1,137 @@
+import math
+from array import array
+from time import monotonic
+from fastapi import Depends, HTTPException, Response
+from limits import parse
+
+from app.config.auth import get_current_user
+from app.config.settings import get_settings
+from app.utils.responses import format_response
+
+# --- Token bucket storage ---
+
+class TokenBucketLimiter:
+    """
+    In-memory token buckets keyed by an arbitrary string.
+    Bucket state lives in two flat float arrays indexed by slot, so each key costs
+    one dict entry plus 16 bytes. Idle buckets are swept incrementally on each call:
+    a bucket idle for idle_ttl seconds is full again, so dropping it loses nothing.
+    """
+    __slots__ = ("idle_ttl", "sweep_step", "_index", "_keys", "_tokens", "_stamps", "_free", "_cursor")
+
+    def __init__(self, idle_ttl: float, sweep_step: int = 64):
+        self.idle_ttl = idle_ttl
+        self.sweep_step = sweep_step
+        self._index: dict[str, int] = {}
+        self._keys: list[str | None] = []
+        self._tokens = array("d")
+        self._stamps = array("d")
+        self._free: list[int] = []
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def acquire(self, key: str, rate: float, capacity: float, cost: float = 1.0) -> tuple[bool, float]:
+        """
+        Take cost tokens from the bucket refilled at rate tokens/second up to capacity.
+        Return (allowed, tokens left).
+        """
+        now = monotonic()
+        slot = self._index.get(key)
+
+        if slot is None:
+            tokens = capacity
+            slot = self._allocate(key)
+        else:
+            tokens = min(capacity, self._tokens[slot] + (now - self._stamps[slot]) * rate)
+
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+
+        self._tokens[slot] = tokens
+        self._stamps[slot] = now
+        self._sweep(now, self.sweep_step)
+        return allowed, tokens
+
+    def evict_idle(self) -> int:
+        """Drop every idle bucket and return how many were removed."""
+        before = len(self._index)
+        self._cursor = 0
+        self._sweep(monotonic(), len(self._keys))
+        return before - len(self._index)
+
+    def _allocate(self, key: str) -> int:
+        if self._free:
+            slot = self._free.pop()
+            self._keys[slot] = key
+        else:
+            slot = len(self._keys)
+            self._keys.append(key)
+            self._tokens.append(0.0)
+            self._stamps.append(0.0)
+        self._index[key] = slot
+        return slot
+
+    def _sweep(self, now: float, steps: int) -> None:
+        size = len(self._keys)
+        if not size:
+            return
+        for _ in range(min(steps, size)):
+            slot = self._cursor
+            self._cursor = (slot + 1) % size
+            key = self._keys[slot]
+            if key is not None and now - self._stamps[slot] >= self.idle_ttl:
+                del self._index[key]
+                self._keys[slot] = None
+                self._free.append(slot)
+
+# --- Per-role quotas ---
+
+def _quota(limit: str, burst: int) -> tuple[float, float]:
+    """Turn a limit string ('60/minute') and burst size into (tokens per second, capacity)."""
+    item = parse(limit)
+    return item.amount / item.get_expiry(), float(burst)
+
+settings = get_settings()
+
+ROLE_QUOTAS = {
+    "user": _quota(settings.rate_limit_user, settings.rate_burst_user),
+    "admin": _quota(settings.rate_limit_admin, settings.rate_burst_admin),
+}
+
+user_limiter = TokenBucketLimiter(
+    idle_ttl=max(capacity / rate for rate, capacity in ROLE_QUOTAS.values())
+)
+
+# --- Dependency ---
+
+async def rate_limit_user(response: Response, current_user: dict = Depends(get_current_user)) -> dict:
+    """
+    Apply the caller's role quota, keyed on the JWT subject, and set RateLimit-* headers.
+    Async so bucket updates run on the event loop rather than in the threadpool.
+    """
+    subject = current_user.get("sub")
+    if not subject:
+        raise HTTPException(status_code=401, detail="Invalid token or missing subject.")
+
+    rate, capacity = ROLE_QUOTAS[current_user["role"]]
+    allowed, tokens = user_limiter.acquire(subject, rate, capacity)
+
+    headers = {
+        "RateLimit-Limit": str(int(capacity)),
+        "RateLimit-Remaining": str(int(tokens)),
+        "RateLimit-Reset": str(math.ceil((capacity - tokens) / rate)),
+    }
+
+    if not allowed:
+        headers["Retry-After"] = str(math.ceil((1.0 - tokens) / rate))
+        raise HTTPException(
+            status_code=429,
+            detail=format_response("error", "Rate limit exceeded.", code=429),
+            headers=headers,
+        )
+
+    response.headers.update(headers)
+    return current_user
@@ -0,0 +1,77 @@
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Application configuration read from the environment.
+    Built once per process by get_settings().
+    """
+    # --- Application ---
+    app_title: str
+    app_description: str
+    app_version: str
+    allowed_origins: list[str]
+
+    # --- Auth ---
+    secret_key: str | None
+    algorithm: str
+    access_token_expire_minutes: int
+    refresh_token_expire_days: int
+
+    # --- Database ---
+    database_url: str | None
+
+    # --- Rate limiting ---
+    rate_limit_global: str
+    rate_limit_login: str
+    rate_limit_register: str
+    rate_limit_user: str
+    rate_burst_user: int
+    rate_limit_admin: str
+    rate_burst_admin: int
+
+    # --- Products ---
+    default_limit: int
+    default_offset: int
+    bulk_batch_size: int
+    product_cache_ttl: float
+
+    # --- Data sync ---
+    sync_batch_size: int
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load environment variables once and return the shared settings."""
+    load_dotenv()
+
+    # Determine environment (Docker vs local)
+    is_docker = os.getenv("DOCKER_ENV", "false").lower() == "true"
+
+    return Settings(
+        app_title=os.getenv("APP_TITLE", "fastAPIStartKit"),
+        app_description=os.getenv("APP_DESCRIPTION", "fastAPIStartKit"),
+        app_version=os.getenv("APP_VERSION", "0.1.0"),
+        allowed_origins=os.getenv("URL", "").split(","),
+        secret_key=os.getenv("SECRET_KEY"),
+        algorithm=os.getenv("ALGORITHM", "HS256"),
+        access_token_expire_minutes=int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30)),
+        refresh_token_expire_days=int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 7)),
+        database_url=os.getenv("DATABASE_URL_DOCKER" if is_docker else "DATABASE_URL_LOCAL"),
+        rate_limit_global=os.getenv("RATE_LIMIT_GLOBAL", "300/minute"),
+        rate_limit_login=os.getenv("RATE_LIMIT_LOGIN", "5/10minutes"),
+        rate_limit_register=os.getenv("RATE_LIMIT_REGISTER", "3/minute"),
+        rate_limit_user=os.getenv("RATE_LIMIT_USER", "60/minute"),
+        rate_burst_user=int(os.getenv("RATE_BURST_USER", 20)),
+        rate_limit_admin=os.getenv("RATE_LIMIT_ADMIN", "600/minute"),
+        rate_burst_admin=int(os.getenv("RATE_BURST_ADMIN", 100)),
+        default_limit=int(os.getenv("DEFAULT_LIMIT", 10)),
+        default_offset=int(os.getenv("DEFAULT_OFFSET", 0)),
+        bulk_batch_size=int(os.getenv("BULK_BATCH_SIZE", 1000)),
+        product_cache_ttl=float(os.getenv("PRODUCT_CACHE_TTL", 0)),
+        sync_batch_size=int(os.getenv("SYNC_BATCH_SIZE", 1000)),
+    )
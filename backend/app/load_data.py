@@ -1,6 +1,5 @@
 import os
 import csv
-import pandas as pd
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from passlib.context import CryptContext
@@ -21,6 +20,8 @@ async def insert_products(session: AsyncSession, csv_path: str) -> None:
     result = await session.execute(select(Product.id))
     if result.scalar() is None:
         try:
+            import pandas as pd  # Deferred: heavy import only needed for loading
+
             df = pd.read_csv(csv_path)
             products = [
                 Product(
@@ -1,20 +1,20 @@
-import os
-from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
+from app.config.settings import get_settings
 from app.routes import products, users
 
-# --- Load environment configuration ---
-load_dotenv()
+# --- Environment configuration ---
+settings = get_settings()
 
-APP_TITLE = os.getenv("APP_TITLE", "fastAPIStartKit")
-APP_DESCRIPTION = os.getenv("APP_DESCRIPTION", "fastAPIStartKit")
-APP_VERSION = os.getenv("APP_VERSION", "0.1.0")
-RATE_LIMIT_GLOBAL = os.getenv("RATE_LIMIT_GLOBAL", "100/minute")
-ALLOWED_ORIGINS = os.getenv("URL", "").split(",")
+APP_TITLE = settings.app_title
+APP_DESCRIPTION = settings.app_description
+APP_VERSION = settings.app_version
+RATE_LIMIT_GLOBAL = settings.rate_limit_global
+ALLOWED_ORIGINS = settings.allowed_origins
 
 # --- Application instance ---
 app = FastAPI(
@@ -28,8 +28,9 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["GET", "POST"],  # Add methods only as needed
+    allow_methods=["GET", "POST", "PUT", "DELETE"],  # Add methods only as needed
     allow_headers=["Authorization", "Content-Type"],  # Restrict to necessary headers
+    expose_headers=["RateLimit-Limit", "RateLimit-Remaining", "RateLimit-Reset", "Retry-After"],
 )
 
 # --- Middleware: Rate Limiting ---
@@ -38,7 +39,7 @@ limiter = Limiter(
     default_limits=[RATE_LIMIT_GLOBAL],
 )
 app.state.limiter = limiter
-app.add_exception_handler(429, _rate_limit_exceeded_handler)
+app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 # --- Routers ---
 app.include_router(products.router)
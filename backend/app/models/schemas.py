@@ -42,6 +42,10 @@ class ProductCreate(ProductBase):
     """Schema used for product creation (input)"""
     pass
 
+class ProductUpsert(ProductCreate):
+    """Schema used for bulk upsert (input). Rows with an existing id are updated."""
+    id: Optional[int] = Field(None, gt=0, description="Product ID to update, omitted to insert")
+
 class ProductOut(BaseModel):
     id: int
     name: str
@@ -1,50 +1,92 @@
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func  # Import func to count total products
+from sqlalchemy import func, insert, update
 from slowapi import Limiter
 from slowapi.util import get_remote_address
-from dotenv import load_dotenv
-import os
 
-from app.config.database import get_db
-from app.config.auth import get_current_user
+from app.config.database import AsyncSessionLocal, get_db
+from app.config.auth import get_current_admin
+from app.config.rate_limit import rate_limit_user
+from app.config.settings import get_settings
 from app.models.models import Product
+from app.models.schemas import ProductCreate, ProductUpsert
+from app.utils.events import event_bus, PRODUCT_CREATED, PRODUCT_UPDATED, PRODUCT_DELETED
 from app.utils.responses import format_response
-
-# Load environment variables
-load_dotenv()
+from app.utils.single_flight import SingleFlight
 
 # Configuration
-DEFAULT_LIMIT = int(os.getenv("DEFAULT_LIMIT", 10))
-DEFAULT_OFFSET = int(os.getenv("DEFAULT_OFFSET", 0))
-RATE_LIMIT_GLOBAL = os.getenv("RATE_LIMIT_GLOBAL", "300/minute")
+settings = get_settings()
+
+DEFAULT_LIMIT = settings.default_limit
+DEFAULT_OFFSET = settings.default_offset
+RATE_LIMIT_GLOBAL = settings.rate_limit_global
+BULK_BATCH_SIZE = settings.bulk_batch_size
+PRODUCT_CACHE_TTL = settings.product_cache_ttl
+BULK_MAX_REPORTED_ERRORS = 100
 
 # Router and rate limiter
 router = APIRouter(tags=["Products"])
 limiter = Limiter(key_func=get_remote_address)
 
+# Identical concurrent reads share one query; writes drop cached and in-flight results
+product_queries = SingleFlight(cache_ttl=PRODUCT_CACHE_TTL)
+
+for event_topic in (PRODUCT_CREATED, PRODUCT_UPDATED, PRODUCT_DELETED):
+    event_bus.subscribe(event_topic, lambda topic, payload: product_queries.invalidate())
+
+# --- Queries ---
+# Shared calls open their own session: a coalesced query must not depend on
+# the lifetime of whichever request happened to start it.
+# Errors are reported like get_db does, since these reads bypass it.
+
+def _database_error(e: Exception) -> HTTPException:
+    return HTTPException(status_code=500, detail={
+        "status": "error",
+        "message": f"Database error: {str(e)}",
+        "code": 500
+    })
+
+async def _fetch_products(limit: int, offset: int) -> tuple[list[Product], int]:
+    try:
+        async with AsyncSessionLocal() as db:
+            # Get total product count for pagination
+            total_count = await db.scalar(select(func.count()).select_from(Product))
+
+            # Get paginated products
+            result = await db.execute(select(Product).limit(limit).offset(offset))
+            return result.scalars().all(), total_count
+    except Exception as e:
+        raise _database_error(e) from e
+
+async def _fetch_product(product_id: int) -> Product | None:
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Product).where(Product.id == product_id)
+            )
+            return result.scalar_one_or_none()
+    except Exception as e:
+        raise _database_error(e) from e
+
 # --- Endpoints ---
 
 @router.get("/api/products")
 @limiter.limit(RATE_LIMIT_GLOBAL)
 async def get_products(
     request: Request,
-    db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    current_user: dict = Depends(rate_limit_user),
     limit: int = Query(DEFAULT_LIMIT, ge=1, le=100, description="Number of products to return (1-100)"),
     offset: int = Query(DEFAULT_OFFSET, ge=0, description="Offset for pagination")
 ):
     """
     Retrieve a paginated list of products for an authenticated user, including total count for pagination.
     """
-
-    # Get total product count for pagination
-    total_count = await db.scalar(select(func.count()).select_from(Product))
-
-    # Get paginated products
-    result = await db.execute(select(Product).limit(limit).offset(offset))
-    products = result.scalars().all()
+    products, total_count = await product_queries.do(
+        ("list", limit, offset),
+        lambda: _fetch_products(limit, offset)
+    )
 
     return format_response(
         status="success",
@@ -59,16 +101,15 @@ async def get_products(
 async def get_product(
     request: Request,
     product_id: int,
-    db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    current_user: dict = Depends(rate_limit_user),
 ):
     """
     Retrieve a single product by ID for an authenticated user.
     """
-    result = await db.execute(
-        select(Product).where(Product.id == product_id)
+    product = await product_queries.do(
+        ("item", product_id),
+        lambda: _fetch_product(product_id)
     )
-    product = result.scalar_one_or_none()
 
     if product is None:
         return format_response(
@@ -83,3 +124,238 @@ async def get_product(
         data=product,
         code=200
     )
+
+
+@router.get("/api/products/metrics", dependencies=[Depends(get_current_admin), Depends(rate_limit_user)])
+async def get_product_query_metrics(request: Request):
+    """
+    Report how many product reads were executed, coalesced or served from cache on this worker (Admin only).
+    """
+    return format_response(
+        status="success",
+        message="Product query metrics retrieved successfully.",
+        data={**product_queries.stats, "in_flight": product_queries.in_flight, "cache_ttl": PRODUCT_CACHE_TTL},
+        code=200
+    )
+
+
+@router.post("/api/product", dependencies=[Depends(get_current_admin), Depends(rate_limit_user)])
+@limiter.limit(RATE_LIMIT_GLOBAL)
+async def create_product(
+    request: Request,
+    product: ProductCreate,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Create a new product (Admin only).
+    """
+    new_product = Product(**product.model_dump())
+
+    db.add(new_product)
+    try:
+        await db.commit()
+        await db.refresh(new_product)
+    except Exception:
+        await db.rollback()
+        return format_response("error", "Database error.", code=500)
+
+    event_bus.publish(PRODUCT_CREATED, {"ids": [new_product.id]})
+
+    return format_response(
+        status="success",
+        message="Product created successfully.",
+        data=new_product,
+        code=201
+    )
+
+
+@router.put("/api/product/{product_id}", dependencies=[Depends(get_current_admin), Depends(rate_limit_user)])
+@limiter.limit(RATE_LIMIT_GLOBAL)
+async def update_product(
+    request: Request,
+    product_id: int,
+    product: ProductCreate,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Replace an existing product by ID (Admin only).
+    """
+    existing = await db.get(Product, product_id)
+    if existing is None:
+        return format_response("error", "Product not found.", code=404)
+
+    for field, value in product.model_dump().items():
+        setattr(existing, field, value)
+
+    try:
+        await db.commit()
+        await db.refresh(existing)
+    except Exception:
+        await db.rollback()
+        return format_response("error", "Database error.", code=500)
+
+    event_bus.publish(PRODUCT_UPDATED, {"ids": [product_id]})
+
+    return format_response(
+        status="success",
+        message="Product updated successfully.",
+        data=existing,
+        code=200
+    )
+
+
+@router.delete("/api/product/{product_id}", dependencies=[Depends(get_current_admin), Depends(rate_limit_user)])
+@limiter.limit(RATE_LIMIT_GLOBAL)
+async def delete_product(
+    request: Request,
+    product_id: int,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Delete a product by ID (Admin only).
+    """
+    existing = await db.get(Product, product_id)
+    if existing is None:
+        return format_response("error", "Product not found.", code=404)
+
+    try:
+        await db.delete(existing)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        return format_response("error", "Database error.", code=500)
+
+    event_bus.publish(PRODUCT_DELETED, {"ids": [product_id]})
+
+    return format_response(
+        status="success",
+        message="Product deleted successfully.",
+        data={"id": product_id},
+        code=200
+    )
+
+
+@router.post("/api/products/bulk", dependencies=[Depends(get_current_admin), Depends(rate_limit_user)])
+@limiter.limit(RATE_LIMIT_GLOBAL)
+async def bulk_upsert_products(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Insert or update many products at once (Admin only).
+    Accepts a JSON array or an NDJSON stream (Content-Type: application/x-ndjson).
+    Items carrying an existing id are updated, the others are inserted.
+    Rows are written in batched transactions; invalid rows are skipped, and the first
+    BULK_MAX_REPORTED_ERRORS of them are reported.
+    """
+    created, updated, skipped, errors = 0, 0, 0, []
+    batch = []
+
+    async def flush():
+        nonlocal created, updated
+        try:
+            created_ids, updated_ids = await _upsert_batch(db, batch)
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            raise RuntimeError(f"Failed to upsert products: {e}")
+        created += len(created_ids)
+        updated += len(updated_ids)
+        if created_ids:
+            event_bus.publish(PRODUCT_CREATED, {"ids": created_ids})
+        if updated_ids:
+            event_bus.publish(PRODUCT_UPDATED, {"ids": updated_ids})
+        batch.clear()
+
+    try:
+        async for index, raw in _iter_bulk_items(request):
+            try:
+                if isinstance(raw, (bytes, str)):
+                    item = ProductUpsert.model_validate_json(raw)
+                else:
+                    item = ProductUpsert.model_validate(raw)
+            except ValidationError as e:
+                skipped += 1
+                if len(errors) < BULK_MAX_REPORTED_ERRORS:
+                    errors.append({
+                        "index": index,
+                        "issue": e.errors(include_url=False, include_context=False, include_input=False)
+                    })
+                continue
+
+            batch.append(item)
+            if len(batch) >= BULK_BATCH_SIZE:
+                await flush()
+
+        if batch:
+            await flush()
+    except ValueError as e:
+        return format_response("error", f"Invalid payload: {e}", code=400)
+    except RuntimeError as e:
+        return format_response(
+            "error",
+            str(e),
+            data={"created": created, "updated": updated, "skipped": skipped},
+            errors=errors,
+            code=500
+        )
+
+    return format_response(
+        status="success",
+        message="Products upserted successfully.",
+        data={"created": created, "updated": updated, "skipped": skipped},
+        errors=errors,
+        code=200
+    )
+
+# --- Bulk helpers ---
+
+async def _iter_bulk_items(request: Request):
+    """Yield (index, raw item) pairs from a JSON array or an NDJSON body."""
+    content_type = request.headers.get("content-type", "")
+
+    if "ndjson" in content_type:
+        index, buffer = 0, b""
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield index, line
+                    index += 1
+        if buffer.strip():
+            yield index, buffer
+        return
+
+    payload = await request.json()
+    if not isinstance(payload, list):
+        raise ValueError("expected a JSON array of products")
+    for index, item in enumerate(payload):
+        yield index, item
+
+
+async def _upsert_batch(db: AsyncSession, items: list[ProductUpsert]) -> tuple[list[int], list[int]]:
+    """Write one batch of products and return (created ids, updated ids)."""
+    # Last occurrence wins when the same id appears twice in a batch
+    keyed = {item.id: item for item in items if item.id is not None}
+    new_rows = [item.model_dump(exclude={"id"}) for item in items if item.id is None]
+
+    existing_ids = set()
+    if keyed:
+        result = await db.execute(select(Product.id).where(Product.id.in_(keyed.keys())))
+        existing_ids = set(result.scalars().all())
+
+    updates = [item.model_dump() for pid, item in keyed.items() if pid in existing_ids]
+    explicit_inserts = [item.model_dump() for pid, item in keyed.items() if pid not in existing_ids]
+
+    if updates:
+        await db.execute(update(Product), updates)
+
+    created_ids = [row["id"] for row in explicit_inserts]
+    if explicit_inserts:
+        await db.execute(insert(Product), explicit_inserts)
+    if new_rows:
+        result = await db.execute(insert(Product).returning(Product.id), new_rows)
+        created_ids.extend(result.scalars().all())
+
+    return created_ids, [row["id"] for row in updates]
@@ -1,6 +1,4 @@
-import os
 import json
-from dotenv import load_dotenv
 from fastapi import APIRouter, Depends, Request, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,15 +15,17 @@ from app.config.auth import (
     verify_password
 )
 from app.config.database import get_db
+from app.config.rate_limit import rate_limit_user
+from app.config.settings import get_settings
 from app.models.models import User
 from app.models.schemas import UserCreate
 from app.utils.responses import format_response
 
-# Load environment variables
-load_dotenv()
+# Configuration
+settings = get_settings()
 
-RATE_LIMIT_LOGIN = os.getenv("RATE_LIMIT_LOGIN", "5/10minutes")
-RATE_LIMIT_REGISTER = os.getenv("RATE_LIMIT_REGISTER", "3/minute")
+RATE_LIMIT_LOGIN = settings.rate_limit_login
+RATE_LIMIT_REGISTER = settings.rate_limit_register
 
 # Setup
 router = APIRouter(tags=["Authentication", "Users"])
@@ -129,7 +129,7 @@ async def login(
         code=200
     )
 
-@router.get("/api/users", dependencies=[Depends(get_current_admin)])
+@router.get("/api/users", dependencies=[Depends(get_current_admin), Depends(rate_limit_user)])
 async def get_users(
     request: Request,
     db: AsyncSession = Depends(get_db)
@@ -152,7 +152,7 @@ async def get_users(
         code=200
     )
 
-@router.get("/api/user/{user_id}", dependencies=[Depends(get_current_admin)])
+@router.get("/api/user/{user_id}", dependencies=[Depends(get_current_admin), Depends(rate_limit_user)])
 async def get_user(
     request: Request,
     user_id: int,
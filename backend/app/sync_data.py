@@ -0,0 +1,289 @@
+import os
+import csv
+import json
+import hashlib
+import datetime
+from array import array
+from sqlalchemy import String, func, insert, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.config.database import AsyncSessionLocal, create_tables
+from app.config.settings import get_settings
+from app.load_data import hash_password
+from app.models.models import Product, User
+
+DELTA_FOLDER = "data/delta"
+CHECKPOINT_FOLDER = "data/checkpoints"
+CHECKPOINT_FILE = os.path.join(CHECKPOINT_FOLDER, "sync.json")
+SYNC_BATCH_SIZE = get_settings().sync_batch_size
+
+# --- Row normalization ---
+# Each table maps a CSV row to the column values compared against the database.
+# User passwords are only set on insert: bcrypt hashes are salted, so they cannot be diffed.
+
+def _product_values(row: dict) -> dict:
+    return {
+        "name": row["name"],
+        "category": row["category"],
+        "price": float(row["price"]),
+    }
+
+def _user_values(row: dict) -> dict:
+    if not all(k in row for k in ("id", "username", "email", "hashed_password", "role")):
+        raise ValueError(f"Incomplete user row: {row}")
+    return {
+        "username": row["username"].strip().lower(),
+        "email": row["email"].strip().lower(),
+        "role": row["role"].strip().lower(),
+    }
+
+TABLES = [
+    (Product, "data.csv", _product_values, ("name", "category", "price")),
+    (User, "users.csv", _user_values, ("username", "email", "role")),
+]
+
+# --- Utilities ---
+
+def row_hash(values) -> int:
+    """
+    Return a stable 64-bit hash of a row's compared values.
+    Numeric values must already be floats so 5 (database) and 5.0 (CSV) match.
+    """
+    raw = repr(tuple(values)).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), "little")
+
+def fields_hash(fields: list) -> int:
+    """Return a stable 64-bit hash of a raw CSV record."""
+    raw = "\x1f".join(fields).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), "little")
+
+def file_digest(path: str) -> str:
+    """Return the sha256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_checkpoint(path: str = CHECKPOINT_FILE) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+def save_checkpoint(checkpoint: dict, path: str = CHECKPOINT_FILE) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(checkpoint, file, indent=2)
+    os.replace(tmp_path, path)
+
+# --- Row hash sidecar ---
+# Per-id hashes of the raw CSV records applied by the last sync, stored as two packed
+# 64-bit arrays (ids then hashes) so multi-million-row tables load in about a second.
+
+def _hashes_path(table: str) -> str:
+    return os.path.join(CHECKPOINT_FOLDER, f"{table}.hashes")
+
+def load_row_hashes(table: str) -> dict | None:
+    path = _hashes_path(table)
+    if not os.path.exists(path):
+        return None
+    count = os.path.getsize(path) // 16
+    ids, hashes = array("q"), array("Q")
+    with open(path, "rb") as file:
+        ids.fromfile(file, count)
+        hashes.fromfile(file, count)
+    return dict(zip(ids, hashes))
+
+def save_row_hashes(table: str, row_hashes: dict) -> None:
+    os.makedirs(CHECKPOINT_FOLDER, exist_ok=True)
+    path = _hashes_path(table)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as file:
+        array("q", row_hashes.keys()).tofile(file)
+        array("Q", row_hashes.values()).tofile(file)
+    os.replace(tmp_path, path)
+
+def _batches(items: list, size: int = SYNC_BATCH_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+# --- Database state ---
+
+async def table_state(session: AsyncSession, model, columns: tuple) -> list:
+    """
+    Return a cheap fingerprint of a table: row count, max id and one aggregate per
+    compared column, computed in SQL. Any insert or delete, and most updates, change it.
+    """
+    aggregates = [func.count(), func.max(model.id)]
+    for col in columns:
+        column = getattr(model, col)
+        if isinstance(column.type, String):
+            aggregates.append(func.sum(func.length(column)))
+        else:
+            aggregates.append(func.sum(column))
+    row = (await session.execute(select(*aggregates))).one()
+    return [None if value is None else str(value) for value in row]
+
+async def load_table_hashes(session: AsyncSession, model, columns: tuple) -> dict:
+    """Return {id: row hash} for the current content of a table."""
+    stmt = select(model.id, *(getattr(model, col) for col in columns))
+    numeric = [not isinstance(getattr(model, col).type, String) for col in columns]
+    result = await session.stream(stmt.execution_options(yield_per=SYNC_BATCH_SIZE))
+    hashes = {}
+    async for partition in result.partitions():
+        for row in partition:
+            values = (
+                float(value) if is_numeric and value is not None else value
+                for value, is_numeric in zip(row[1:], numeric)
+            )
+            hashes[row[0]] = row_hash(values)
+    return hashes
+
+async def _existing_ids(session: AsyncSession, model, ids: list) -> set:
+    found = set()
+    for batch in _batches(ids):
+        result = await session.execute(select(model.id).where(model.id.in_(batch)))
+        found.update(result.scalars().all())
+    return found
+
+# --- Diff and apply ---
+
+async def sync_table(
+    session: AsyncSession,
+    model,
+    csv_path: str,
+    normalize,
+    columns: tuple,
+    baseline: dict | None = None,
+    prune: bool = False,
+) -> tuple[dict, dict]:
+    """
+    Apply the inserts, updates and deletes needed to make a table match its CSV.
+    baseline holds the raw record hashes from the last sync when the table has not
+    changed since: only records whose hash differs are parsed and applied.
+    Without it, the whole table is read and compared value by value.
+    Return (stats, raw record hashes of the CSV).
+    """
+    incremental = baseline is not None
+    if not incremental:
+        baseline = await load_table_hashes(session, model, columns)
+
+    csv_hashes, candidates, updates = {}, {}, []
+
+    with open(csv_path, "r", newline="", encoding="utf-8") as file:
+        reader = csv.reader(file)
+        header = next(reader)
+        id_index = header.index("id")
+
+        for fields in reader:
+            if not fields:
+                continue
+            row_id = int(fields[id_index])
+            digest = fields_hash(fields)
+            csv_hashes[row_id] = digest
+
+            previous = baseline.get(row_id)
+            if incremental and previous == digest:
+                continue
+
+            row = dict(zip(header, fields))
+            values = normalize(row)
+            if previous is None:
+                candidates[row_id] = (row, values)
+            elif incremental or previous != row_hash(values[col] for col in columns):
+                values["id"] = row_id
+                updates.append(values)
+
+    # Rows new to the CSV may still exist in the table (e.g. created through the API)
+    existing = await _existing_ids(session, model, list(candidates))
+    inserts = []
+    for row_id, (row, values) in candidates.items():
+        values["id"] = row_id
+        if row_id in existing:
+            updates.append(values)
+            continue
+        if model is User:
+            values["hashed_password"] = hash_password(row["hashed_password"])
+        inserts.append(values)
+
+    deletes = []
+    if prune:
+        result = await session.stream(select(model.id).execution_options(yield_per=SYNC_BATCH_SIZE))
+        async for partition in result.partitions():
+            deletes.extend(row_id for (row_id,) in partition if row_id not in csv_hashes)
+
+    for batch in _batches(deletes):
+        await session.execute(delete(model).where(model.id.in_(batch)))
+    for batch in _batches(updates):
+        await session.execute(update(model), batch)
+    for batch in _batches(inserts):
+        await session.execute(insert(model), batch)
+
+    stats = {"inserted": len(inserts), "updated": len(updates), "deleted": len(deletes)}
+    return stats, csv_hashes
+
+# --- Main synchronizer ---
+
+async def sync_delta_data(prune: bool = False, force: bool = False):
+    """
+    Incrementally sync data/delta CSVs into the database.
+    A table is skipped when neither its CSV nor the table changed since the last
+    checkpoint (and that sync pruned, if prune is requested). Otherwise the CSV is
+    diffed against the stored row hashes, or against the table itself if it changed.
+    Rows absent from the CSVs (e.g. registered users) are only deleted when prune is set.
+    """
+    await create_tables()
+    checkpoint = {} if force else load_checkpoint()
+
+    for model, filename, normalize, columns in TABLES:
+        table = model.__tablename__
+        csv_path = os.path.join(DELTA_FOLDER, filename)
+        stat = os.stat(csv_path)
+        previous = checkpoint.get(table, {})
+
+        async with AsyncSessionLocal() as session:
+            try:
+                state = await table_state(session, model, columns)
+                table_unchanged = bool(previous) and previous.get("db_state") == state
+
+                if table_unchanged and (previous.get("pruned") or not prune):
+                    file_unchanged = (
+                        previous.get("size") == stat.st_size and previous.get("mtime") == stat.st_mtime
+                    ) or previous.get("sha256") == file_digest(csv_path)
+                    if file_unchanged:
+                        print(f"{table}: unchanged since last sync, skipped.")
+                        continue
+
+                baseline = load_row_hashes(table) if table_unchanged else None
+                stats, csv_hashes = await sync_table(
+                    session, model, csv_path, normalize, columns, baseline=baseline, prune=prune
+                )
+                await session.commit()
+                state = await table_state(session, model, columns)
+            except Exception as e:
+                await session.rollback()
+                print(f"Error syncing {table}: {e}")
+                return
+
+        mode = "incremental" if baseline is not None else "full diff"
+        print(f"{table}: {stats['inserted']} inserted, {stats['updated']} updated, {stats['deleted']} deleted ({mode}).")
+
+        save_row_hashes(table, csv_hashes)
+        checkpoint[table] = {
+            "sha256": file_digest(csv_path),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "db_state": state,
+            "pruned": prune,
+            "synced_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        }
+        save_checkpoint(checkpoint)
+
+# --- Entry point ---
+
+if __name__ == "__main__":
+    import asyncio
+    asyncio.run(sync_delta_data())
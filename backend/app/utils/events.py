@@ -0,0 +1,53 @@
+import asyncio
+import inspect
+from collections import defaultdict
+from typing import Any, Callable
+
+# --- Topics ---
+
+PRODUCT_CREATED = "product.created"
+PRODUCT_UPDATED = "product.updated"
+PRODUCT_DELETED = "product.deleted"
+
+
+class EventBus:
+    """
+    Minimal in-process publish/subscribe bus.
+    Sync handlers run inline, coroutine handlers are scheduled on the running loop
+    so publishers never wait on subscribers.
+    """
+
+    def __init__(self):
+        self._subscribers: dict[str, list[Callable[[str, Any], Any]]] = defaultdict(list)
+        self._pending: set[asyncio.Task] = set()
+
+    def subscribe(self, topic: str, handler: Callable[[str, Any], Any]) -> None:
+        """Register a handler called as handler(topic, payload)."""
+        if handler not in self._subscribers[topic]:
+            self._subscribers[topic].append(handler)
+
+    def unsubscribe(self, topic: str, handler: Callable[[str, Any], Any]) -> None:
+        """Remove a previously registered handler."""
+        if handler in self._subscribers.get(topic, []):
+            self._subscribers[topic].remove(handler)
+
+    def publish(self, topic: str, payload: Any = None) -> None:
+        """Dispatch an event to every subscriber of the topic."""
+        for handler in list(self._subscribers.get(topic, [])):
+            try:
+                result = handler(topic, payload)
+                if inspect.isawaitable(result):
+                    task = asyncio.ensure_future(result)
+                    self._pending.add(task)
+                    task.add_done_callback(self._on_done)
+            except Exception as e:
+                print(f"Event handler failed for {topic}: {e}")
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception():
+            print(f"Event handler failed: {task.exception()}")
+
+
+# Shared bus for the application
+event_bus = EventBus()
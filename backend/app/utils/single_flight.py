@@ -0,0 +1,68 @@
+import asyncio
+from time import monotonic
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent async calls into a single execution.
+    Callers sharing a key while a call is in flight await the same task.
+    With cache_ttl > 0, results are also reused for that many seconds,
+    keeping at most max_entries keys.
+    """
+
+    def __init__(self, cache_ttl: float = 0.0, max_entries: int = 1024):
+        self.cache_ttl = cache_ttl
+        self.max_entries = max_entries
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self._cache: dict[Hashable, tuple[float, Any]] = {}
+        self._generation = 0
+        self.stats = {"requests": 0, "executed": 0, "coalesced": 0, "cache_hits": 0}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently executing."""
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Return fn()'s result, sharing it with concurrent callers of the same key."""
+        self.stats["requests"] += 1
+
+        if self.cache_ttl > 0:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > monotonic():
+                self.stats["cache_hits"] += 1
+                return cached[1]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+        else:
+            self.stats["executed"] += 1
+            # Capture the generation now so a write during the call prevents caching its result
+            generation = self._generation
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, g=generation: self._on_done(key, done, g))
+
+        # Shield so one cancelled caller does not cancel the shared call for the others
+        return await asyncio.shield(task)
+
+    def invalidate(self) -> None:
+        """Drop cached results; calls already in flight are neither joined nor cached."""
+        self._generation += 1
+        self._cache.clear()
+        self._inflight.clear()
+
+    def _on_done(self, key: Hashable, task: asyncio.Task, generation: int) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if self.cache_ttl > 0 and generation == self._generation:
+            now = monotonic()
+            if len(self._cache) >= self.max_entries:
+                self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+                if len(self._cache) >= self.max_entries:
+                    self._cache.clear()
+            self._cache[key] = (now + self.cache_ttl, task.result())
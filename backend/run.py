@@ -1,27 +1,50 @@
 import argparse
-import uvicorn
-import asyncio
-from app.load_data import insert_initial_data
-from app.export_db import export_database
+
+# Heavy imports (uvicorn, pandas, SQLAlchemy) are deferred to the command that needs them
 
 def launch_app():
     """Start FastAPI"""
+    import uvicorn
+
     uvicorn.run("app.main:app", host="0.0.0.0", port=8080, reload=True)
 
 def load_data():
     """Load initial data"""
+    import asyncio
+    from app.load_data import insert_initial_data
+
     asyncio.run(insert_initial_data())
 
+def sync_data(prune: bool = False, force: bool = False):
+    """Incrementally sync delta CSVs into the database"""
+    import asyncio
+    from app.sync_data import sync_delta_data
+
+    asyncio.run(sync_delta_data(prune=prune, force=force))
+
 def export_data():
     """Export full database to CSV"""
+    import asyncio
+    from app.export_db import export_database
+
     asyncio.run(export_database())
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Manage API execution")
     parser.add_argument(
         "mode",
-        choices=["app", "load", "export"],
-        help="Choose 'app' to start FastAPI, 'load' to insert data, or 'export' to save database to CSV."
+        choices=["app", "load", "sync", "export"],
+        help="Choose 'app' to start FastAPI, 'load' to insert data, 'sync' to apply delta CSV changes, or 'export' to save database to CSV."
+    )
+    parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="With 'sync', delete database rows that are absent from the CSV (including registered users)."
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="With 'sync', ignore the checkpoint and diff every file."
     )
 
     args = parser.parse_args()
@@ -30,5 +53,7 @@ if __name__ == "__main__":
         launch_app()
     elif args.mode == "load":
         load_data()
+    elif args.mode == "sync":
+        sync_data(prune=args.prune, force=args.full)
     elif args.mode == "export":
         export_data()
@@ -0,0 +1,60 @@
+import asyncio
+
+from app.utils.single_flight import SingleFlight
+
+
+def test_concurrent_calls_are_coalesced():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+        return flight, calls, results
+
+    flight, calls, results = asyncio.run(scenario())
+
+    assert results == ["value"] * 5
+    assert calls == 1
+    assert flight.stats["executed"] == 1
+    assert flight.stats["coalesced"] == 4
+
+
+def test_invalidate_during_in_flight_read_is_not_cached():
+    async def scenario():
+        flight = SingleFlight(cache_ttl=10)
+        data = {"value": "old"}
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def fetch():
+            value = data["value"]
+            started.set()
+            await release.wait()
+            return value
+
+        pending = asyncio.ensure_future(flight.do("k", fetch))
+        await started.wait()
+
+        # A write lands while the read is still in flight
+        data["value"] = "new"
+        flight.invalidate()
+        release.set()
+        stale = await pending
+
+        async def fetch_again():
+            return data["value"]
+
+        fresh = await flight.do("k", fetch_again)
+        return flight, stale, fresh
+
+    flight, stale, fresh = asyncio.run(scenario())
+
+    assert stale == "old"
+    assert fresh == "new"
+    assert flight.stats["cache_hits"] == 0
@@ -0,0 +1,72 @@
+"""
+Import-time benchmark based on `python -X importtime`.
+
+Usage (from backend/):
+    python tools/importtime.py                      # benchmark app.main
+    python tools/importtime.py app.main app.load_data --top 15
+    python tools/importtime.py app.main --max-ms 800  # exit 1 if slower
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(module: str) -> dict[str, tuple[int, int]]:
+    """Import a module in a fresh interpreter and return {module: (self_us, cumulative_us)}."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        errors = [line for line in proc.stderr.splitlines() if line.strip() and not line.startswith("import time:")]
+        raise RuntimeError(f"Failed to import {module}: {errors[-1] if errors else 'unknown error'}")
+
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure module import time")
+    parser.add_argument("modules", nargs="*", default=["app.main"], help="Modules to import")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreter runs per module")
+    parser.add_argument("--top", type=int, default=10, help="Slowest dependencies to list")
+    parser.add_argument("--max-ms", type=float, help="Fail if the median import time exceeds this")
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        try:
+            runs = [measure(module) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(e)
+            failed = True
+            continue
+        totals = [run[module][1] / 1000 for run in runs]
+        median_ms = statistics.median(totals)
+
+        print(f"{module}: median {median_ms:.1f} ms (min {min(totals):.1f}, max {max(totals):.1f}, {args.runs} runs)")
+        deps = [item for item in runs[-1].items() if item[0] != module]
+        slowest = sorted(deps, key=lambda item: item[1][1], reverse=True)
+        for name, (_, cumulative_us) in slowest[:args.top]:
+            print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+        if args.max_ms is not None and median_ms > args.max_ms:
+            print(f"{module}: {median_ms:.1f} ms exceeds budget of {args.max_ms:.1f} ms")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()